@@ -79,6 +79,7 @@ contract Distributor {
     DistributionRound   public distributionRound;
 
     bool                public leftoverWithdrawn;
+    uint256             public totalAllocated;
 
     event Participated(address indexed account, uint256 timestamp);
     event Registered(address indexed account, uint256 timestamp);
@@ -283,19 +284,72 @@ contract Distributor {
     function setMultipleAddressDistributionAmount(Allocation[] memory _allocations) public onlyAdmin {
         require(_allocations.length > 0, 'The allocation array must contain one element at least');
 
+        uint256 allocated = totalAllocated;
+
         for (uint i = 0; i < _allocations.length; i++) {
             Allocation memory allocation = _allocations[i];
             require(registrations[allocation.user].isRegistered, 'Provided address is not registered');
 
+            allocated = allocated
+                .sub(registrations[allocation.user].distributionAmount)
+                .add(allocation.amount);
             registrations[allocation.user].distributionAmount = allocation.amount;
         }
 
+        require(
+            allocated <= distribution.amountOfTokensToDistribute,
+            'Total allocation exceeds amount of tokens to distribute'
+        );
+        totalAllocated = allocated;
+
+        emit AllocationsSet(block.timestamp);
+    }
+
+    /**
+        @notice Sets allocations packed one per word as `amount << 160 | user`,
+                so the amount must fit into 96 bits. Reverts if the running
+                total exceeds the amount of tokens to distribute.
+     */
+    function setPackedAddressDistributionAmounts(uint256[] calldata _packedAllocations) public onlyAdmin {
+        require(distribution.isCreated, 'Distribution is not created');
+        require(_packedAllocations.length > 0, 'The allocation array must contain one element at least');
+
+        uint256 allocated = totalAllocated;
+
+        for (uint i = 0; i < _packedAllocations.length; i++) {
+            uint256 packedAllocation = _packedAllocations[i];
+            uint256 amount = packedAllocation >> 160;
+
+            Registration storage registration = registrations[address(uint160(packedAllocation))];
+            require(registration.isRegistered, 'Provided address is not registered');
+
+            allocated = allocated
+                .sub(registration.distributionAmount)
+                .add(amount);
+            registration.distributionAmount = amount;
+        }
+
+        require(
+            allocated <= distribution.amountOfTokensToDistribute,
+            'Total allocation exceeds amount of tokens to distribute'
+        );
+        totalAllocated = allocated;
+
         emit AllocationsSet(block.timestamp);
     }
 
     function setAddressDistributionAmount(address _address, uint256 _amount) public onlyAdmin {
         require(registrations[_address].isRegistered, 'Provided address is not registered');
 
+        uint256 allocated = totalAllocated
+            .sub(registrations[_address].distributionAmount)
+            .add(_amount);
+        require(
+            allocated <= distribution.amountOfTokensToDistribute,
+            'Total allocation exceeds amount of tokens to distribute'
+        );
+
+        totalAllocated = allocated;
         registrations[_address].distributionAmount = _amount;
     }
 
@@ -387,6 +441,16 @@ contract Distributor {
         return addresses;
     }
 
+    function getRegistrations(address[] memory _addresses) public view returns (Registration[] memory) {
+        Registration[] memory result = new Registration[](_addresses.length);
+
+        for (uint i = 0; i < _addresses.length; i++) {
+            result[i] = registrations[_addresses[i]];
+        }
+
+        return result;
+    }
+
     function getVestingPortions() public view returns (uint256[] memory) {
         return vestingPercentPerPortion;
     }
@@ -0,0 +1,147 @@
+from brownie import Distributor
+from scripts.deploy import get_account, DEPLOYER
+
+import csv
+import re
+
+ADDRESS_BITS = 160
+AMOUNT_BITS = 96
+ADDRESS_PATTERN = re.compile(r"^0x[0-9a-fA-F]{40}$")
+
+# Upper bounds for the cost of setPackedAddressDistributionAmounts. The call
+# overhead covers the cold SLOADs of admin, distribution and totalAllocated,
+# a zero to non-zero totalAllocated SSTORE and the event. Every entry pays two
+# cold SLOADs (isRegistered, distributionAmount), a zero to non-zero SSTORE and
+# the loop itself, plus its calldata. tests/test_allocations.py checks them
+# against executed transactions.
+TX_BASE_GAS = 21000
+CALL_OVERHEAD_GAS = 35000
+ENTRY_GAS = 2100 + 2100 + 20000 + 1000
+
+DEFAULT_BATCH_GAS_LIMIT = 8000000
+REGISTRATIONS_CHUNK = 500
+
+def pack_allocation(address, amount):
+    address = str(address)
+    amount = int(amount)
+
+    if not ADDRESS_PATTERN.match(address):
+        raise ValueError(f"Invalid address {address}")
+    if amount < 0 or amount >= 1 << AMOUNT_BITS:
+        raise ValueError(f"Amount {amount} of {address} does not fit into {AMOUNT_BITS} bits")
+
+    return amount << ADDRESS_BITS | int(address, 16)
+
+def unpack_allocation(packed):
+    address = "0x" + format(packed & ((1 << ADDRESS_BITS) - 1), "040x")
+    amount = packed >> ADDRESS_BITS
+
+    return address, amount
+
+def load_allocations(path):
+    allocations = []
+
+    with open(path, "r") as file:
+        for row in csv.reader(file):
+            if not row or not row[0].strip().startswith("0x"):
+                continue
+
+            allocations.append((row[0].strip(), int(row[1].strip())))
+
+    return allocations
+
+def deduplicate_allocations(allocations):
+    unique = {}
+
+    for address, amount in allocations:
+        key = str(address).lower()
+        unique.pop(key, None)
+        unique[key] = (address, amount)
+
+    return list(unique.values())
+
+def calldata_gas(packed):
+    data = packed.to_bytes(32, "big")
+
+    return sum(4 if byte == 0 else 16 for byte in data)
+
+def estimate_batch_gas(batch):
+    return TX_BASE_GAS + CALL_OVERHEAD_GAS + sum(ENTRY_GAS + calldata_gas(packed) for packed in batch)
+
+def split_into_batches(allocations, gas_limit=DEFAULT_BATCH_GAS_LIMIT):
+    batches = []
+    batch = []
+    batch_gas = TX_BASE_GAS + CALL_OVERHEAD_GAS
+
+    for address, amount in allocations:
+        packed = pack_allocation(address, amount)
+        entry_gas = ENTRY_GAS + calldata_gas(packed)
+
+        if batch and batch_gas + entry_gas > gas_limit:
+            batches.append(batch)
+            batch = []
+            batch_gas = TX_BASE_GAS + CALL_OVERHEAD_GAS
+
+        if batch_gas + entry_gas > gas_limit:
+            raise ValueError(f"Gas limit {gas_limit} is too low for a single allocation")
+
+        batch.append(packed)
+        batch_gas += entry_gas
+
+    if batch:
+        batches.append(batch)
+
+    return batches
+
+def check_allocations(distributor, allocations):
+    allocated = distributor.totalAllocated()
+
+    for i in range(0, len(allocations), REGISTRATIONS_CHUNK):
+        chunk = allocations[i:i + REGISTRATIONS_CHUNK]
+        registrations = distributor.getRegistrations([address for address, _ in chunk])
+
+        for (address, amount), registration in zip(chunk, registrations):
+            if not registration[2]:
+                raise ValueError(f"Address {address} is not registered")
+
+            allocated = allocated - registration[1] + amount
+
+    amount_of_tokens_to_distribute = distributor.distribution()[4]
+    if allocated > amount_of_tokens_to_distribute:
+        raise ValueError(
+            f"Total allocation {allocated} exceeds amount of tokens to distribute {amount_of_tokens_to_distribute}")
+
+    return allocated
+
+# Batches are separate transactions, so the resulting on-chain total is checked
+# before the first one is sent. If a batch still fails, rerun with the same file
+# and start_batch set to the failed batch index; the check is unaffected since
+# the already applied batches set the same amounts again.
+def set_allocations(distributor, admin, allocations, gas_limit=DEFAULT_BATCH_GAS_LIMIT, start_batch=0):
+    allocations = deduplicate_allocations(allocations)
+    batches = split_into_batches(allocations, gas_limit)
+
+    check_allocations(distributor, allocations)
+
+    transactions = []
+    for index, batch in enumerate(batches):
+        if index < start_batch:
+            continue
+
+        try:
+            tx = distributor.setPackedAddressDistributionAmounts(batch, { "from": admin })
+        except Exception:
+            print(f"Batch {index} of {len(batches)} failed, resume with start_batch={index}")
+            raise
+
+        print(f"Batch {index} of {len(batches)}: {len(batch)} allocations, {tx.txid}, {tx.gas_used} gas")
+        transactions.append(tx)
+
+    return transactions
+
+def main(path, distributor_address, gas_limit=DEFAULT_BATCH_GAS_LIMIT, start_batch=0):
+    admin = get_account(DEPLOYER)
+    distributor = Distributor.at(distributor_address)
+
+    allocations = load_allocations(path)
+    set_allocations(distributor, admin, allocations, int(gas_limit), int(start_batch))
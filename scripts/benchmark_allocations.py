@@ -0,0 +1,83 @@
+from brownie import accounts, web3, Distributor
+from scripts.deploy import *
+from scripts.allocations import pack_allocation
+
+import os
+
+BLOCK_GAS_LIMIT = 12000000
+SIZES = [50, 100, 150]
+REGISTRATION_CHUNK = 100
+AMOUNT = 10 ** 18
+
+def random_addresses(count):
+    return [web3.toChecksumAddress("0x" + os.urandom(20).hex()) for _ in range(count)]
+
+def register_addresses(distributor, admin, addresses):
+    for i in range(0, len(addresses), REGISTRATION_CHUNK):
+        distributor.registerMultipleUsers(addresses[i:i + REGISTRATION_CHUNK], { "from": admin })
+
+def deploy_distributor(factory, token, deployer, admin):
+    factory.create({ "from": admin })
+    distributor = Distributor.at(factory.indexesToContracts(factory.contractsCount() - 1))
+
+    set_registration_round(distributor, admin)
+    set_distribution_parameters(distributor, admin, token, deployer)
+
+    # Every measured call starts with the same warm state: totalAllocated is
+    # already non-zero, so its SSTORE costs the same for both functions.
+    warmup = random_addresses(1)
+    register_addresses(distributor, admin, warmup)
+    distributor.setAddressDistributionAmount(warmup[0], AMOUNT, { "from": admin })
+
+    return distributor
+
+def measure(distributor, admin, size, packed):
+    addresses = random_addresses(size)
+    register_addresses(distributor, admin, addresses)
+
+    if packed:
+        allocations = [pack_allocation(address, AMOUNT) for address in addresses]
+        tx = distributor.setPackedAddressDistributionAmounts(allocations, { "from": admin })
+    else:
+        allocations = [(address, AMOUNT) for address in addresses]
+        tx = distributor.setMultipleAddressDistributionAmount(allocations, { "from": admin })
+
+    return tx.gas_used, (len(tx.input) - 2) // 2
+
+def fit(points):
+    n = len(points)
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in points) / sum((x - mean_x) ** 2 for x, _ in points)
+    intercept = mean_y - slope * mean_x
+    max_residual = max(abs(y - (intercept + slope * x)) for x, y in points)
+
+    return slope, intercept, max_residual
+
+def report(name, results):
+    gas_per_user, fixed_gas, max_residual = fit([(size, gas) for size, (gas, _) in results.items()])
+    calldata_per_user, _, _ = fit([(size, calldata) for size, (_, calldata) in results.items()])
+    users_per_tx = int((BLOCK_GAS_LIMIT - fixed_gas) // gas_per_user)
+
+    print(f"{name}:")
+    for size, (gas, calldata) in sorted(results.items()):
+        print(f"  {size} users: {gas} gas, {calldata} calldata bytes")
+    print(f"  marginal gas per user: {gas_per_user:.0f} (fixed {fixed_gas:.0f}, max residual {max_residual:.0f})")
+    print(f"  calldata bytes per user: {calldata_per_user:.0f}")
+    print(f"  users per transaction at {BLOCK_GAS_LIMIT} gas: {users_per_tx}")
+
+def main():
+    deployer = accounts[0]
+    admin = accounts[1]
+
+    token = deploy_token(deployer)
+    factory = deploy_factory(deployer)
+
+    for name, packed in [("setMultipleAddressDistributionAmount", False), ("setPackedAddressDistributionAmounts", True)]:
+        results = {}
+        for size in SIZES:
+            distributor = deploy_distributor(factory, token, deployer, admin)
+            results[size] = measure(distributor, admin, size, packed)
+
+        report(name, results)
@@ -0,0 +1,254 @@
+from brownie import accounts, reverts, Distributor
+from scripts.deploy import *
+from scripts.allocations import *
+
+import pytest
+
+@pytest.fixture
+def distributor(factory, admin):
+    factory.create({ "from": admin })
+    address = factory.indexesToContracts(0)
+
+    return Distributor.at(address)
+
+@pytest.fixture
+def token(deployer):
+    return deploy_token(deployer)
+
+@pytest.fixture
+def factory(deployer):
+    return deploy_factory(deployer)
+
+@pytest.fixture
+def deployer():
+    return accounts[0]
+
+@pytest.fixture
+def admin():
+    return accounts[1]
+
+@pytest.fixture
+def owner():
+    return accounts[2]
+
+@pytest.fixture
+def users():
+    return accounts[3:6]
+
+def register_users(distributor, admin, token, owner, users):
+    set_registration_round(distributor, admin)
+    set_distribution_parameters(distributor, admin, token, owner)
+
+    distributor.registerMultipleUsers(users, { "from": admin })
+
+def test_pack_allocation_should_unpack(users):
+    packed = pack_allocation(users[0].address, 50 * 10e18)
+
+    address, amount = unpack_allocation(packed)
+
+    assert address == users[0].address.lower()
+    assert amount == 50 * 10e18
+
+def test_pack_allocation_with_too_large_amount_should_fail(users):
+    with pytest.raises(ValueError):
+        pack_allocation(users[0].address, 1 << AMOUNT_BITS)
+
+def test_split_into_batches_should_respect_gas_limit(users):
+    allocations = [(users[i % len(users)].address, i + 1) for i in range(100)]
+    gas_limit = TX_BASE_GAS + CALL_OVERHEAD_GAS + 10 * (ENTRY_GAS + 32 * 16)
+
+    batches = split_into_batches(allocations, gas_limit)
+
+    assert sum(len(batch) for batch in batches) == 100
+    assert all(estimate_batch_gas(batch) <= gas_limit for batch in batches)
+    assert len(batches) == 10
+
+def test_set_packed_allocations_should_set(distributor, admin, token, owner, users):
+    register_users(distributor, admin, token, owner, users)
+
+    allocations = [pack_allocation(user.address, 10 * 10e18) for user in users]
+    distributor.setPackedAddressDistributionAmounts(allocations, { "from": admin })
+
+    for user in users:
+        assert distributor.registrations(user)[1] == 10 * 10e18
+    assert distributor.totalAllocated() == 30 * 10e18
+
+def test_set_packed_allocations_twice_should_replace_total(distributor, admin, token, owner, users):
+    register_users(distributor, admin, token, owner, users)
+
+    distributor.setPackedAddressDistributionAmounts(
+        [pack_allocation(user.address, 10 * 10e18) for user in users],
+        { "from": admin })
+    distributor.setPackedAddressDistributionAmounts(
+        [pack_allocation(users[0].address, 40 * 10e18)],
+        { "from": admin })
+
+    assert distributor.registrations(users[0])[1] == 40 * 10e18
+    assert distributor.totalAllocated() == 60 * 10e18
+
+def test_set_packed_allocations_over_amount_to_distribute_should_fail(distributor, admin, token, owner, users):
+    register_users(distributor, admin, token, owner, users)
+
+    allocations = [pack_allocation(user.address, 50 * 10e18) for user in users]
+
+    with reverts('Total allocation exceeds amount of tokens to distribute'):
+        distributor.setPackedAddressDistributionAmounts(allocations, { "from": admin })
+
+def test_set_packed_allocations_for_not_registered_should_fail(distributor, admin, token, owner, users):
+    register_users(distributor, admin, token, owner, users)
+
+    with reverts('Provided address is not registered'):
+        distributor.setPackedAddressDistributionAmounts(
+            [pack_allocation(owner.address, 10 * 10e18)],
+            { "from": admin })
+
+def test_set_packed_allocations_as_not_admin_should_fail(distributor, admin, token, owner, users):
+    register_users(distributor, admin, token, owner, users)
+
+    with reverts('Allows admin address only'):
+        distributor.setPackedAddressDistributionAmounts(
+            [pack_allocation(users[0].address, 10 * 10e18)],
+            { "from": users[0] })
+
+def test_set_allocation_should_update_total(distributor, admin, token, owner, users):
+    register_users(distributor, admin, token, owner, users)
+
+    distributor.setAddressDistributionAmount(users[0], 50 * 10e18, { "from": admin })
+    distributor.setMultipleAddressDistributionAmount([(users[0], 20 * 10e18), (users[1], 5 * 10e18)], { "from": admin })
+
+    assert distributor.totalAllocated() == 25 * 10e18
+
+def test_pack_allocation_with_invalid_address_should_fail():
+    for address in ["-0x1", "ab" * 20, "0x1234", "0x" + "g" * 40, "0x" + "a" * 41]:
+        with pytest.raises(ValueError):
+            pack_allocation(address, 5)
+
+def test_load_allocations_should_skip_header_and_strip(tmp_path, users):
+    path = tmp_path / "allocations.csv"
+    path.write_text(
+        "address,amount\n"
+        f" {users[0].address} , 10 \n"
+        "\n"
+        f"{users[1].address},20\n")
+
+    allocations = load_allocations(path)
+
+    assert allocations == [(users[0].address, 10), (users[1].address, 20)]
+
+def test_deduplicate_allocations_should_keep_last(users):
+    allocations = [(users[0].address, 1), (users[1].address, 2), (users[0].address.lower(), 3)]
+
+    assert deduplicate_allocations(allocations) == [(users[1].address, 2), (users[0].address.lower(), 3)]
+
+def test_set_packed_allocations_with_same_user_twice_should_keep_last(distributor, admin, token, owner, users):
+    register_users(distributor, admin, token, owner, users)
+
+    allocations = [pack_allocation(users[0].address, 60 * 10e18), pack_allocation(users[0].address, 30 * 10e18)]
+    distributor.setPackedAddressDistributionAmounts(allocations, { "from": admin })
+
+    assert distributor.registrations(users[0])[1] == 30 * 10e18
+    assert distributor.totalAllocated() == 30 * 10e18
+
+def test_set_allocation_over_amount_to_distribute_should_fail(distributor, admin, token, owner, users):
+    register_users(distributor, admin, token, owner, users)
+
+    with reverts('Total allocation exceeds amount of tokens to distribute'):
+        distributor.setAddressDistributionAmount(users[0], 101 * 10e18, { "from": admin })
+    with reverts('Total allocation exceeds amount of tokens to distribute'):
+        distributor.setMultipleAddressDistributionAmount([(users[0], 60 * 10e18), (users[1], 60 * 10e18)], { "from": admin })
+
+def test_set_packed_allocations_after_legacy_setter_near_cap(distributor, admin, token, owner, users):
+    register_users(distributor, admin, token, owner, users)
+
+    distributor.setAddressDistributionAmount(users[0], 90 * 10e18, { "from": admin })
+    distributor.setPackedAddressDistributionAmounts([pack_allocation(users[1].address, 10 * 10e18)], { "from": admin })
+
+    assert distributor.totalAllocated() == 100 * 10e18
+
+    with reverts('Total allocation exceeds amount of tokens to distribute'):
+        distributor.setPackedAddressDistributionAmounts([pack_allocation(users[2].address, 1)], { "from": admin })
+
+    distributor.setPackedAddressDistributionAmounts(
+        [pack_allocation(users[0].address, 80 * 10e18), pack_allocation(users[2].address, 10 * 10e18)],
+        { "from": admin })
+
+    assert distributor.totalAllocated() == 100 * 10e18
+
+def test_set_allocations_should_use_on_chain_total(distributor, admin, token, owner, users):
+    register_users(distributor, admin, token, owner, users)
+    distributor.setAddressDistributionAmount(users[0], 90 * 10e18, { "from": admin })
+
+    set_allocations(distributor, admin, [(users[0].address, 60 * 10e18), (users[0].address, 95 * 10e18)])
+
+    assert distributor.registrations(users[0])[1] == 95 * 10e18
+    assert distributor.totalAllocated() == 95 * 10e18
+
+def test_set_allocations_over_on_chain_cap_should_send_nothing(distributor, admin, token, owner, users):
+    register_users(distributor, admin, token, owner, users)
+    distributor.setAddressDistributionAmount(users[2], 90 * 10e18, { "from": admin })
+
+    allocations = [(users[0].address, 10 * 10e18), (users[1].address, 10 * 10e18)]
+    gas_limit = TX_BASE_GAS + CALL_OVERHEAD_GAS + ENTRY_GAS + 32 * 16
+
+    with pytest.raises(ValueError):
+        set_allocations(distributor, admin, allocations, gas_limit)
+
+    assert distributor.registrations(users[0])[1] == 0
+    assert distributor.totalAllocated() == 90 * 10e18
+
+def test_set_allocations_should_resume_from_batch(distributor, admin, token, owner, users):
+    register_users(distributor, admin, token, owner, users)
+
+    allocations = [(user.address, 10 * 10e18) for user in users]
+    gas_limit = TX_BASE_GAS + CALL_OVERHEAD_GAS + ENTRY_GAS + 32 * 16
+
+    transactions = set_allocations(distributor, admin, allocations, gas_limit, start_batch=1)
+
+    assert len(transactions) == 2
+    assert distributor.registrations(users[0])[1] == 0
+    assert distributor.totalAllocated() == 20 * 10e18
+
+def test_get_registrations_should_return_in_order(distributor, admin, token, owner, users):
+    register_users(distributor, admin, token, owner, users)
+    distributor.setAddressDistributionAmount(users[1], 10 * 10e18, { "from": admin })
+
+    registrations = distributor.getRegistrations([users[1], owner, users[0]])
+
+    assert registrations[0][1] == 10 * 10e18 and registrations[0][2] is True
+    assert registrations[1][2] is False
+    assert registrations[2][1] == 0 and registrations[2][2] is True
+
+def test_estimate_batch_gas_should_cover_first_single_allocation(distributor, admin, token, owner, users):
+    register_users(distributor, admin, token, owner, users)
+
+    batch = [pack_allocation(users[0].address, 10 * 10e18)]
+    tx = distributor.setPackedAddressDistributionAmounts(batch, { "from": admin })
+
+    assert tx.gas_used <= estimate_batch_gas(batch)
+
+def test_estimate_batch_gas_should_cover_first_multiple_allocations(distributor, admin, token, owner):
+    set_registration_round(distributor, admin)
+    set_distribution_parameters(distributor, admin, token, owner)
+
+    addresses = [accounts.add().address for _ in range(20)]
+    distributor.registerMultipleUsers(addresses, { "from": admin })
+
+    batch = [pack_allocation(address, 10 ** 18 + i) for i, address in enumerate(addresses)]
+    tx = distributor.setPackedAddressDistributionAmounts(batch, { "from": admin })
+
+    assert tx.gas_used <= estimate_batch_gas(batch)
+
+def test_split_into_batches_should_fit_executed_gas(distributor, admin, token, owner):
+    set_registration_round(distributor, admin)
+    set_distribution_parameters(distributor, admin, token, owner)
+
+    addresses = [accounts.add().address for _ in range(12)]
+    distributor.registerMultipleUsers(addresses, { "from": admin })
+
+    gas_limit = TX_BASE_GAS + CALL_OVERHEAD_GAS + 5 * (ENTRY_GAS + 32 * 16)
+    batches = split_into_batches([(address, 10 ** 18) for address in addresses], gas_limit)
+
+    for batch in batches:
+        tx = distributor.setPackedAddressDistributionAmounts(batch, { "from": admin, "gas_limit": gas_limit })
+
+        assert tx.gas_used <= estimate_batch_gas(batch) <= gas_limit